@@ -1,8 +1,10 @@
 """Cardnews CLI package."""
 
+from functools import lru_cache
 from importlib import metadata
 
 
+@lru_cache(maxsize=None)
 def get_version() -> str:
     """Return the package version, or '0.0.0' if metadata is unavailable."""
     try:
@@ -2,28 +2,77 @@
 
 from __future__ import annotations
 
-import copy
-import datetime as _dt
+import hashlib
+import itertools
 import math
+import multiprocessing
+import os
+import re
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, Mapping, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
 
 import click
 from click.core import ParameterSource
-from PIL import Image as PILImage
 
 from . import get_version
-from .config import DEFAULT_CONFIG, load_config, save_config, update_config
-from .gemini import (
-    DEFAULT_IMAGE_MODEL,
-    DEFAULT_TEXT_MODEL,
-    GeminiNotConfigured,
-    generate_background_image,
-    generate_cards as gemini_generate_cards,
-    get_api_key,
+from .config import DEFAULT_CONFIG, default_config, get_cache_dir, load_config, save_config, update_config
+
+if TYPE_CHECKING:  # pragma: no cover - Pillow and the cardnews submodules load lazily per command
+    from PIL import Image as PILImage
+
+    from .gemini import RateLimiter
+    from .image import FontSpec, RenderOptions
+
+
+# Short aliases accepted by `cardnews config --set`, alongside full dotted paths.
+_CONFIG_KEY_PATHS: Dict[str, Tuple[str, ...]] = {
+    "font-title": ("fonts", "title", "path"),
+    "font-title-size": ("fonts", "title", "size"),
+    "font-subtitle": ("fonts", "subtitle", "path"),
+    "font-subtitle-size": ("fonts", "subtitle", "size"),
+    "font-business": ("fonts", "business", "path"),
+    "font-business-size": ("fonts", "business", "size"),
+    "width": ("image", "width"),
+    "height": ("image", "height"),
+}
+_SIZE_RE = re.compile(r"^\s*(\d{1,5})\s*x\s*(\d{1,5})\s*$", re.IGNORECASE)
+_INT_KEYS = frozenset(
+    {"width", "height", "size", "overlay_alpha", "concurrency", "rpm", "batch_timeout"}
+    | {"jpeg_quality", "png_compress_level", "webp_quality", "webp_method"}
 )
-from .image import FontSpec, RenderOptions, create_brand_card, create_card, generate_prompt_gradient
-from .io import load_card, load_cards
+# Encoder settings with a fixed valid range; JPEG quality above 95 only inflates files (Pillow's guidance).
+_INT_RANGES: Dict[str, Tuple[int, int]] = {
+    "jpeg_quality": (1, 95),
+    "webp_quality": (1, 100),
+    "png_compress_level": (0, 9),
+    "webp_method": (0, 6),
+}
+_BOOL_KEYS = frozenset({"overlay", "shadow", "cache", "batch_mode", "jpeg_optimize", "jpeg_progressive"})
+_REALISTIC_REQUIREMENT = "실사스러운 이미지를 생성"
+
+# Recently used Gemini backgrounds; bounded because the on-disk cache already covers reruns.
+_BACKGROUND_CACHE: OrderedDict[Tuple[str, str, str], PILImage.Image] = OrderedDict()
+_BACKGROUND_CACHE_SIZE = 8
+_BACKGROUND_CACHE_LOCK = threading.Lock()
+_WORKER_STATE: Dict[str, Any] = {}
+# Smallest batch worth a process pool; below this, worker start-up outweighs the parallel speed-up.
+_PROCESS_RENDER_MIN_JOBS = 8
+
+
+@dataclass
+class _BatchJob:
+    title: str
+    subtitle: str
+    prompt: str
+    background_path: Optional[str]
+    output_path: Path
 
 
 @click.group()
@@ -31,8 +80,7 @@ from .io import load_card, load_cards
 @click.pass_context
 def main(ctx: click.Context) -> None:
     """Nanobanana 스타일의 인스타그램 카드뉴스를 생성하는 CLI."""
-    ctx.ensure_object(dict)
-    ctx.obj["config"] = load_config()
+    ctx.ensure_object(dict).setdefault("_warnings", set())
 
 
 @main.command()
@@ -61,7 +109,10 @@ def create(
     dry_run: bool,
 ) -> None:
     """단일 카드뉴스 이미지를 생성합니다."""
-    config = ctx.obj["config"]
+    from .gemini import get_api_key
+    from .image import create_card
+
+    config = _get_config(ctx)
     card_data = _load_card_input(input, title, subtitle, image_prompt)
     card_data["image_prompt"] = _ensure_realistic_prompt(card_data.get("image_prompt"))
 
@@ -82,7 +133,7 @@ def create(
         output = Path(card_data["output"])
 
     if not output:
-        default_name = f"card_{_dt.datetime.now().strftime('%Y%m%d_%H%M%S')}.jpg"
+        default_name = f"card_{time.strftime('%Y%m%d_%H%M%S')}.jpg"
         output_str = click.prompt("출력 파일 경로", default=default_name)
         output = Path(output_str)
 
@@ -123,7 +174,7 @@ def create(
         click.echo(f"[DRY-RUN] {output}에 저장될 이미지를 생성했습니다.")
         return
 
-    image.save(output)
+    _save_image(image, output, config)
     click.echo(f"생성 완료: {output}")
 
 
@@ -133,6 +184,7 @@ def create(
 @click.option("--size", type=str, default=None, help="출력 사이즈, 예: 1080x1080")
 @click.option("--no-overlay", is_flag=True, help="텍스트 영역 오버레이 비활성화")
 @click.option("--no-shadow", is_flag=True, help="텍스트 그림자 비활성화")
+@click.option("--batch-mode", is_flag=True, help="Gemini Batch Mode로 배경 생성 (50% 저렴, 완료까지 대기)")
 @click.pass_context
 def batch(
     ctx: click.Context,
@@ -141,50 +193,118 @@ def batch(
     size: Optional[str],
     no_overlay: bool,
     no_shadow: bool,
+    batch_mode: bool,
 ) -> None:
     """여러 카드뉴스를 일괄로 생성합니다."""
-    config = ctx.obj["config"]
-    cards = load_cards(str(input))
-    if not cards:
-        raise click.UsageError("입력 파일에서 카드 데이터를 찾을 수 없습니다.")
+    from .gemini import get_api_key
+    from .io import iter_cards
 
-    output_dir.mkdir(parents=True, exist_ok=True)
+    config = _get_config(ctx)
     options = _build_render_options(config, size, no_overlay, no_shadow)
     fonts = _fonts_from_config(config)
     api_key = get_api_key()
-
-    with click.progressbar(enumerate(cards, start=1), label="카드뉴스 생성 중", length=len(cards)) as progress:
-        for idx, entry in progress:
-            output_path = entry.get("output") or f"card_{idx:02}.jpg"
-            background_path = entry.get("background_path")
-            background_image = None
-            prompt_value = _ensure_realistic_prompt(entry.get("image_prompt"))
-            if background_path:
-                background_path = str(background_path)
-            else:
-                if not prompt_value:
-                    raise click.UsageError(
-                        f"배경 이미지를 생성하려면 입력 데이터에 image_prompt 값을 제공해야 합니다. (index={idx})"
-                    )
-                background_image = _maybe_generate_background(
-                    ctx,
-                    prompt=prompt_value,
-                    options=options,
-                    config=config,
-                    api_key=api_key,
-                )
-            image = create_card(
+    gemini_cfg = config["gemini"]
+    concurrency = _int_setting(gemini_cfg.get("concurrency", 4), "gemini.concurrency")
+    aspect_ratio = _aspect_ratio_string(options.width, options.height)
+    batch_mode = batch_mode or gemini_cfg.get("batch_mode") is True
+
+    jobs: List[_BatchJob] = []
+    for idx, entry in enumerate(iter_cards(str(input)), start=1):
+        background_path = entry.get("background_path")
+        prompt_value = _ensure_realistic_prompt(entry.get("image_prompt"))
+        if not background_path and not prompt_value:
+            raise click.UsageError(
+                f"배경 이미지를 생성하려면 입력 데이터에 image_prompt 값을 제공해야 합니다. (index={idx})"
+            )
+        jobs.append(
+            _BatchJob(
                 title=entry.get("title", ""),
                 subtitle=entry.get("subtitle", ""),
                 prompt=prompt_value,
-                background_path=background_path,
-                fonts=fonts,
-                options=options,
-                background_image=background_image,
+                background_path=str(background_path) if background_path else None,
+                output_path=output_dir / (entry.get("output") or f"card_{idx:02}.jpg"),
+            )
+        )
+    if not jobs:
+        raise click.UsageError("입력 파일에서 카드 데이터를 찾을 수 없습니다.")
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    def fetch_backgrounds(waiting: List[_BatchJob]) -> List[Optional[PILImage.Image]]:
+        if batch_mode:
+            return _generate_backgrounds_batch(
+                ctx, [job.prompt for job in waiting], config=config, api_key=api_key, aspect_ratio=aspect_ratio
             )
-            image.save(output_dir / output_path)
+        background = _maybe_generate_background(
+            ctx,
+            prompt=waiting[0].prompt,
+            options=options,
+            config=config,
+            api_key=api_key,
+            aspect_ratio=aspect_ratio,
+        )
+        return [background] * len(waiting)
+
+    unique_jobs: List[_BatchJob] = []
+    duplicates: List[Tuple[_BatchJob, _BatchJob]] = []
+    first_seen: Dict[Tuple[object, ...], _BatchJob] = {}
+    for job in jobs:
+        original = first_seen.setdefault(_batch_job_key(job), job)
+        if original is job:
+            unique_jobs.append(job)
+        else:
+            duplicates.append((job, original))
+
+    render_workers = min(os.cpu_count() or 1, len(unique_jobs))
+    renderers: Executor
+    if len(unique_jobs) < _PROCESS_RENDER_MIN_JOBS:
+        # Starting worker processes costs more than rendering a handful of cards on threads;
+        # Pillow releases the GIL while resizing, filtering and rasterising text.
+        renderers = ThreadPoolExecutor(
+            max_workers=render_workers, initializer=_init_render_worker, initargs=(fonts, options, config)
+        )
+    else:
+        renderers = ProcessPoolExecutor(
+            max_workers=render_workers,
+            mp_context=_render_pool_context(),
+            initializer=_init_render_worker,
+            initargs=(fonts, options, config),
+        )
+    with ThreadPoolExecutor(max_workers=concurrency) as fetchers, renderers, click.progressbar(
+        length=len(jobs), label="카드뉴스 생성 중"
+    ) as progress:
+        if api_key:
+            ready = [job for job in unique_jobs if job.background_path]
+            pending = [job for job in unique_jobs if not job.background_path]
+        else:
+            if any(not job.background_path for job in unique_jobs):
+                _warn_gemini_missing(ctx)
+            ready, pending = unique_jobs, []
+
+        # Batch Mode sends every prompt as one job; otherwise one in-flight fetch per prompt,
+        # and every card sharing it renders from the same result.
+        groups: Dict[str, List[_BatchJob]] = {}
+        for job in pending:
+            groups.setdefault("" if batch_mode else job.prompt, []).append(job)
+        fetches = {fetchers.submit(fetch_backgrounds, waiting): waiting for waiting in groups.values()}
+        outstanding = set(fetches)
+        outstanding.update(renderers.submit(_render_card_file, job, None) for job in ready)
+        while outstanding:
+            done, outstanding = wait(outstanding, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in fetches:
+                    outstanding.update(
+                        renderers.submit(_render_card_file, job, background)
+                        for job, background in zip(fetches[future], future.result())
+                    )
+                else:
+                    future.result()
+                    progress.update(1)
+        for job, original in duplicates:
+            if job.output_path != original.output_path:
+                shutil.copyfile(original.output_path, job.output_path)
+            progress.update(1)
 
-    click.echo(f"총 {len(cards)}개의 이미지를 {output_dir}에 저장했습니다.")
+    click.echo(f"총 {len(jobs)}개의 이미지를 {output_dir}에 저장했습니다.")
 
 
 @main.command(name="brand-card")
@@ -220,24 +340,33 @@ def brand_card(
 ) -> None:
     """512x512 브랜드 카드 템플릿을 생성합니다."""
 
-    config = ctx.obj["config"]
-    brand_cfg = config.get("brand_card", {}) if isinstance(config, dict) else {}
+    from .gemini import get_api_key
+    from .image import RenderOptions, create_brand_card, generate_prompt_gradient
+    from .io import load_card
+
+    config = _get_config(ctx)
+    brand_cfg = config["brand_card"]
+    defaulted = frozenset(
+        name
+        for name in ("overlay_alpha", "no_overlay", "shadow")
+        if ctx.get_parameter_source(name) == ParameterSource.DEFAULT
+    )
 
-    if ctx.get_parameter_source("overlay_alpha") == ParameterSource.DEFAULT:
-        overlay_from_cfg = brand_cfg.get("overlay_alpha") if isinstance(brand_cfg, Mapping) else None
+    if "overlay_alpha" in defaulted:
+        overlay_from_cfg = brand_cfg.get("overlay_alpha")
         if overlay_from_cfg is not None:
             try:
                 overlay_alpha = int(overlay_from_cfg)
             except (TypeError, ValueError) as err:
                 raise click.UsageError("brand_card.overlay_alpha 값은 정수여야 합니다.") from err
 
-    if ctx.get_parameter_source("no_overlay") == ParameterSource.DEFAULT:
-        overlay_enabled = brand_cfg.get("overlay") if isinstance(brand_cfg, Mapping) else None
+    if "no_overlay" in defaulted:
+        overlay_enabled = brand_cfg.get("overlay")
         if isinstance(overlay_enabled, bool):
             no_overlay = not overlay_enabled
 
-    if ctx.get_parameter_source("shadow") == ParameterSource.DEFAULT:
-        shadow_default = brand_cfg.get("shadow") if isinstance(brand_cfg, Mapping) else None
+    if "shadow" in defaulted:
+        shadow_default = brand_cfg.get("shadow")
         if isinstance(shadow_default, bool):
             shadow = shadow_default
 
@@ -295,7 +424,7 @@ def brand_card(
         raise click.UsageError("배경 이미지를 위한 경로 또는 프롬프트가 필요합니다.")
 
     if not output_value:
-        default_name = f"brand_card_{_dt.datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+        default_name = f"brand_card_{time.strftime('%Y%m%d_%H%M%S')}.png"
         if interactive:
             output_value = Path(click.prompt("출력 파일 경로", default=default_name))
         else:
@@ -333,6 +462,7 @@ def brand_card(
         font_specs=font_overrides,
         overlay_color=overlay_color,
         shadow=shadow,
+        resample=_resample_setting(config),
     )
 
     if dry_run:
@@ -340,7 +470,7 @@ def brand_card(
         return
 
     output_value.parent.mkdir(parents=True, exist_ok=True)
-    image.save(output_value)
+    _save_image(image, output_value, config)
     click.echo(f"생성 완료: {output_value}")
 
 
@@ -364,44 +494,65 @@ def generate(
     no_shadow: bool,
 ) -> None:
     """Gemini API를 사용하여 카드 콘텐츠와 이미지를 자동 생성합니다."""
-    config = ctx.obj["config"]
+    from .gemini import DEFAULT_IMAGE_MODEL, DEFAULT_TEXT_MODEL, get_api_key
+    from .gemini import generate_cards as gemini_generate_cards
+    from .image import create_card
+
+    config = _get_config(ctx)
     options = _build_render_options(config, size, no_overlay, no_shadow)
     fonts = _fonts_from_config(config)
 
     api_key = get_api_key()
-    gemini_cfg = config.get("gemini", {}) if isinstance(config, dict) else {}
+    gemini_cfg = config["gemini"]
     model_name = gemini_cfg.get("model", DEFAULT_TEXT_MODEL)
     image_model = gemini_cfg.get("image_model", DEFAULT_IMAGE_MODEL)
+    concurrency = _int_setting(gemini_cfg.get("concurrency", 4), "gemini.concurrency")
+    aspect_ratio = _aspect_ratio_string(options.width, options.height)
     cards = gemini_generate_cards(topic=topic, count=count, style=style, model_name=model_name, api_key=api_key)
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    for index, card in enumerate(cards, start=1):
-        filename = f"{topic}_{index:02}.jpg"
-        background_path = card.get("background_path")
-        if background_path:
-            background_path = str(background_path)
-            background_image = None
+    def fetch_background(prompt: str) -> Optional[PILImage.Image]:
+        return _maybe_generate_background(
+            ctx,
+            prompt=prompt,
+            options=options,
+            config=config,
+            api_key=api_key,
+            image_model=image_model,
+            aspect_ratio=aspect_ratio,
+        )
+
+    with ThreadPoolExecutor(max_workers=concurrency) as fetchers, ThreadPoolExecutor(max_workers=2) as writers:
+        if api_key:
+            # Cards sharing a prompt wait on one in-flight fetch instead of each calling Gemini.
+            prompts = [None if card.get("background_path") else card.get("image_prompt") or None for card in cards]
+            fetches = {prompt: fetchers.submit(fetch_background, prompt) for prompt in dict.fromkeys(prompts) if prompt}
+            backgrounds: Iterable[Optional[PILImage.Image]] = (
+                fetches[prompt].result() if prompt else None for prompt in prompts
+            )
         else:
-            background_image = _maybe_generate_background(
-                ctx,
+            if any(card.get("image_prompt") and not card.get("background_path") for card in cards):
+                _warn_gemini_missing(ctx)
+            backgrounds = itertools.repeat(None)
+        saves: List[Tuple[str, Future]] = []
+        for index, (card, background_image) in enumerate(zip(cards, backgrounds), start=1):
+            filename = f"{topic}_{index:02}.jpg"
+            background_path = card.get("background_path")
+            image = create_card(
+                title=card.get("title", ""),
+                subtitle=card.get("subtitle", ""),
                 prompt=card.get("image_prompt"),
+                background_path=str(background_path) if background_path else None,
+                fonts=fonts,
                 options=options,
-                config=config,
-                api_key=api_key,
-                image_model=image_model,
+                background_image=background_image,
             )
-        image = create_card(
-            title=card.get("title", ""),
-            subtitle=card.get("subtitle", ""),
-            prompt=card.get("image_prompt"),
-            background_path=background_path,
-            fonts=fonts,
-            options=options,
-            background_image=background_image,
-        )
-        image.save(output_dir / filename)
-        click.echo(f"생성 완료: {filename}")
+            saves.append((filename, writers.submit(_save_image, image, output_dir / filename, config)))
+
+        for filename, future in saves:
+            future.result()
+            click.echo(f"생성 완료: {filename}")
 
 
 @main.command()
@@ -411,30 +562,44 @@ def generate(
 @click.pass_context
 def config(ctx: click.Context, get_keys: Iterable[str], set_pairs: Iterable[Tuple[str, str]], reset: bool) -> None:
     """CLI 동작에 사용되는 설정을 관리합니다."""
-    current = copy.deepcopy(DEFAULT_CONFIG) if reset else ctx.obj["config"]
+    current = default_config() if reset else _get_config(ctx)
 
     if reset:
         save_config(DEFAULT_CONFIG)
-        ctx.obj["config"] = copy.deepcopy(DEFAULT_CONFIG)
+        ctx.obj["config"] = current
         click.echo("설정을 초기화했습니다.")
 
     if set_pairs:
         updates: Dict[str, object] = {}
         for key, value in set_pairs:
             _apply_config_update(updates, key, value)
-        merged = update_config(updates)
+        try:
+            merged = update_config(updates)
+        except RuntimeError as err:
+            raise click.UsageError(str(err)) from err
         ctx.obj["config"] = merged
         current = merged
 
     if get_keys:
-        for key in get_keys:
-            click.echo(f"{key}: {_lookup_key(current, key)}")
+        prefixes: Dict[Tuple[str, ...], object] = {(): current}
+        click.echo("\n".join(f"{key}: {_lookup_key(current, key, prefixes)}" for key in get_keys))
         return
 
     if not set_pairs and not reset:
-        click.echo("현재 설정:")
-        for key, value in current.items():
-            click.echo(f"- {key}: {value}")
+        lines = ["현재 설정:"]
+        lines.extend(f"- {key}: {value}" for key, value in current.items())
+        click.echo("\n".join(lines))
+
+
+def _get_config(ctx: click.Context) -> Dict[str, Any]:
+    """Load the configuration on first use so `--help` paths never read it."""
+    obj = ctx.ensure_object(dict)
+    if "config" not in obj:
+        try:
+            obj["config"] = load_config()
+        except RuntimeError as err:
+            raise click.ClickException(f"{err} `cardnews config --reset`으로 초기화할 수 있습니다.") from err
+    return obj["config"]
 
 
 def _load_card_input(
@@ -443,6 +608,8 @@ def _load_card_input(
     subtitle: Optional[str],
     image_prompt: Optional[str],
 ) -> Dict[str, str]:
+    from .io import load_card
+
     data: Dict[str, str] = {"title": title or "", "subtitle": subtitle or "", "image_prompt": image_prompt or ""}
     if input_path:
         loaded = load_card(str(input_path))
@@ -451,44 +618,153 @@ def _load_card_input(
 
 
 def _build_render_options(
-    config: Dict[str, object],
+    config: Dict[str, Any],
     size: Optional[str],
     no_overlay: bool,
     no_shadow: bool,
 ) -> RenderOptions:
-    image_cfg = config.get("image", {}) if isinstance(config, dict) else {}
+    from .image import RenderOptions
+
+    image_cfg = config["image"]
     width = int(image_cfg.get("width", 1080))
     height = int(image_cfg.get("height", 1080))
     overlay_enabled = bool(image_cfg.get("overlay", True))
     if size:
-        try:
-            width, height = [int(part) for part in size.lower().split("x", 1)]
-        except Exception as err:
-            raise click.UsageError("사이즈는 WIDTHxHEIGHT 형식이어야 합니다.") from err
+        width, height = _parse_size(size)
     return RenderOptions(
         width=width,
         height=height,
         add_overlay=overlay_enabled and not no_overlay,
         shadow=not no_shadow,
+        resample=_resample_setting(config),
+    )
+
+
+def _resample_setting(config: Dict[str, Any]) -> Optional[str]:
+    """Return the configured `image.resample` filter name, or None for the automatic choice."""
+    from .image import RESAMPLE_FILTERS
+
+    value = _string_or_default(config["image"].get("resample"), "auto").strip().lower()
+    if value in ("", "auto"):
+        return None
+    if value not in RESAMPLE_FILTERS:
+        choices = ", ".join(["auto", *RESAMPLE_FILTERS])
+        raise click.UsageError(f"image.resample 값은 {choices} 중 하나여야 합니다.")
+    return value
+
+
+@lru_cache(maxsize=32)
+def _parse_size(size: str) -> Tuple[int, int]:
+    match = _SIZE_RE.match(size)
+    if not match:
+        raise click.UsageError("사이즈는 WIDTHxHEIGHT 형식이어야 합니다.")
+    return int(match[1]), int(match[2])
+
+
+def _batch_job_key(job: _BatchJob) -> Tuple[object, ...]:
+    """Identify batch entries that would render to identical files."""
+    signature: Optional[Tuple[int, int]] = None
+    if job.background_path:
+        try:
+            stat = os.stat(job.background_path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            pass
+    return (job.title, job.subtitle, job.prompt, job.background_path, signature, job.output_path.suffix.lower())
+
+
+def _render_pool_context() -> multiprocessing.context.BaseContext:
+    """Start render workers from a clean process; forking next to live fetch threads can deadlock."""
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(["cardnews.cli", "cardnews.image"])
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+def _init_render_worker(fonts: Tuple[FontSpec, FontSpec], options: RenderOptions, config: Dict[str, Any]) -> None:
+    """Stash the per-run render settings once per worker instead of pickling them per card."""
+    _WORKER_STATE.update(fonts=fonts, options=options, config=config)
+
+
+def _render_card_file(job: _BatchJob, background_image: Optional[PILImage.Image]) -> Path:
+    """Render and save one batch card; runs inside a worker process or render thread."""
+    from .image import create_card
+
+    config = _WORKER_STATE["config"]
+    if background_image is None and job.background_path:
+        options = _WORKER_STATE["options"]
+        background_image = _load_background_cached(
+            str(Path(job.background_path).resolve()), min(options.width, options.height), options.resample
+        )
+    image = create_card(
+        title=job.title,
+        subtitle=job.subtitle,
+        prompt=job.prompt,
+        background_path=job.background_path,
+        fonts=_WORKER_STATE["fonts"],
+        options=_WORKER_STATE["options"],
+        background_image=background_image,
     )
+    _save_image(image, job.output_path, config)
+    return job.output_path
+
+
+def _save_image(image: PILImage.Image, path: Path, config: Dict[str, Any]) -> None:
+    """Save with explicit encoder settings from the ``output`` config section."""
+    output_cfg = config["output"]
+    suffix = path.suffix.lower()
+    if suffix in (".jpg", ".jpeg"):
+        quality = _int_setting(output_cfg.get("jpeg_quality", 75), "output.jpeg_quality", *_INT_RANGES["jpeg_quality"])
+        image.save(
+            path,
+            format="JPEG",
+            quality=quality,
+            optimize=output_cfg.get("jpeg_optimize", True) is not False,
+            progressive=output_cfg.get("jpeg_progressive", True) is not False,
+            subsampling=2,
+        )
+    elif suffix == ".png":
+        compress_level = _int_setting(
+            output_cfg.get("png_compress_level", 6), "output.png_compress_level", *_INT_RANGES["png_compress_level"]
+        )
+        image.save(path, format="PNG", compress_level=compress_level)
+    elif suffix == ".webp":
+        quality = _int_setting(output_cfg.get("webp_quality", 82), "output.webp_quality", *_INT_RANGES["webp_quality"])
+        method = _int_setting(output_cfg.get("webp_method", 4), "output.webp_method", minimum=0)
+        image.save(path, format="WEBP", quality=quality, method=min(method, 6))
+    else:
+        image.save(path)
+
+
+@lru_cache(maxsize=4)
+def _load_background_cached(path: str, size: int, resample: Optional[str]) -> PILImage.Image:
+    """Decode and fit a background once per process so repeated batch entries skip both steps.
+
+    The result is already `size` square, so `create_card` uses it without resampling again. Only a
+    few are kept: each fitted frame is several MB, and batches rarely share more than a handful.
+    """
+    from .image import load_background
+
+    return load_background(path, (size, size), resample)
 
 
-def _fonts_from_config(config: Dict[str, object]) -> Tuple[FontSpec, FontSpec]:
+def _fonts_from_config(config: Dict[str, Any]) -> Tuple[FontSpec, FontSpec]:
     title_font = _font_spec_from_config(config, "title", 72)
     subtitle_font = _font_spec_from_config(config, "subtitle", 42)
     return (title_font, subtitle_font)
 
 
-def _brand_font_overrides(config: Dict[str, object]) -> Optional[Dict[str, FontSpec]]:
-    brand_cfg = config.get("brand_card", {}) if isinstance(config, dict) else {}
-    fonts_cfg = brand_cfg.get("fonts", {}) if isinstance(brand_cfg, Mapping) else {}
-    if not isinstance(fonts_cfg, Mapping):
-        return None
+def _brand_font_overrides(config: Dict[str, Any]) -> Optional[Dict[str, FontSpec]]:
+    from .image import FontSpec
+
+    brand_cfg = config["brand_card"]
+    fonts_cfg = brand_cfg["fonts"]
 
     overrides: Dict[str, FontSpec] = {}
     for key in ("brand", "title", "subtitle", "footer"):
         entry = fonts_cfg.get(key)
-        if not isinstance(entry, Mapping):
+        if not isinstance(entry, dict):
             continue
         path = _string_or_default(entry.get("path")) or None
         size_value = entry.get("size")
@@ -503,9 +779,10 @@ def _brand_font_overrides(config: Dict[str, object]) -> Optional[Dict[str, FontS
     return overrides or None
 
 
-def _font_spec_from_config(config: Dict[str, object], key: str, default_size: int) -> FontSpec:
-    fonts_cfg = config.get("fonts", {}) if isinstance(config, dict) else {}
-    entry = fonts_cfg.get(key, {}) if isinstance(fonts_cfg, Mapping) else {}
+def _font_spec_from_config(config: Dict[str, Any], key: str, default_size: int) -> FontSpec:
+    from .image import FontSpec
+
+    entry = config["fonts"].get(key, {})
     path = _string_or_default(entry.get("path")) or None
     size_value = entry.get("size")
     try:
@@ -515,72 +792,133 @@ def _font_spec_from_config(config: Dict[str, object], key: str, default_size: in
     return FontSpec(path=path, size=size)
 
 
+def _int_setting(value: object, key: str, minimum: int = 1, maximum: Optional[int] = None) -> int:
+    try:
+        number = int(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError) as err:
+        raise click.UsageError(f"{key} 값은 정수여야 합니다.") from err
+    if maximum is not None and not minimum <= number <= maximum:
+        raise click.UsageError(f"{key} 값은 {minimum}~{maximum} 범위의 정수여야 합니다.")
+    if number < minimum:
+        raise click.UsageError(f"{key} 값은 {minimum} 이상의 정수여야 합니다.")
+    return number
+
+
 def _string_or_default(value: Optional[object], default: str = "") -> str:
+    if type(value) is str:
+        return value
     if value is None:
         return default
     return str(value)
 
 
+@lru_cache(maxsize=256)
 def _ensure_realistic_prompt(prompt: Optional[str]) -> str:
-    requirement = "실사스러운 이미지를 생성"
     text = (prompt or "").strip()
     if not text:
         return ""
-    if requirement in text:
+    if _REALISTIC_REQUIREMENT in text:
         return text
-    return f"{text} {requirement}".strip()
+    return f"{text} {_REALISTIC_REQUIREMENT}"
 
 
 def _apply_config_update(target: Dict[str, object], key: str, value: str) -> None:
-    parts = key.split(".")
+    parts = _CONFIG_KEY_PATHS.get(key) or _split_dotted(key)
     cursor: Dict[str, object] = target
+    default: object = DEFAULT_CONFIG
     for segment in parts[:-1]:
+        default = default.get(segment) if isinstance(default, dict) else None
+        if default is not None and not isinstance(default, dict):
+            raise click.UsageError(f"{segment}에 하위 키를 설정할 수 없습니다.")
         cursor = cursor.setdefault(segment, {})  # type: ignore[assignment]
-        if not isinstance(cursor, dict):  # pragma: no cover - defensive
+        if not isinstance(cursor, dict):
             raise click.UsageError(f"{segment}에 하위 키를 설정할 수 없습니다.")
-    cursor[parts[-1]] = value
+    if isinstance(default, dict) and isinstance(default.get(parts[-1]), dict):
+        raise click.UsageError(f"{key}는 설정 섹션이므로 값을 직접 지정할 수 없습니다. 하위 키를 지정하세요.")
+    cursor[parts[-1]] = _coerce_config_value(key, parts[-1], value)
 
 
-def _lookup_key(data: Dict[str, object], dotted: str):
-    parts = dotted.split(".")
-    cursor: object = data
-    for part in parts:
-        if isinstance(cursor, Mapping) and part in cursor:
-            cursor = cursor[part]
-        else:
+def _coerce_config_value(key: str, leaf: str, value: str) -> object:
+    if leaf in _INT_RANGES:
+        return _int_setting(value, key, *_INT_RANGES[leaf])
+    if leaf in _INT_KEYS:
+        try:
+            return int(value)
+        except ValueError as err:
+            raise click.UsageError(f"{key} 값은 정수여야 합니다.") from err
+    if leaf in _BOOL_KEYS:
+        lowered = value.strip().lower()
+        if lowered in ("true", "1", "yes", "on"):
+            return True
+        if lowered in ("false", "0", "no", "off"):
+            return False
+        raise click.UsageError(f"{key} 값은 true 또는 false여야 합니다.")
+    return value
+
+
+def _lookup_key(data: Dict[str, object], dotted: str, prefixes: Optional[Dict[Tuple[str, ...], object]] = None):
+    """Resolve a dotted key or `config --set` alias, reusing (and filling) already-walked prefixes when given."""
+    parts = _CONFIG_KEY_PATHS.get(dotted) or _split_dotted(dotted)
+    if prefixes is None:
+        prefixes = {(): data}
+    depth = len(parts)
+    while parts[:depth] not in prefixes:
+        depth -= 1
+    cursor = prefixes[parts[:depth]]
+    for index in range(depth, len(parts)):
+        if not isinstance(cursor, dict):
             return None
+        cursor = cursor.get(parts[index])
+        prefixes[parts[: index + 1]] = cursor
     return cursor
 
 
+@lru_cache(maxsize=64)
+def _split_dotted(dotted: str) -> Tuple[str, ...]:
+    return tuple(dotted.split("."))
+
+
 def _maybe_generate_background(
     ctx: click.Context,
     *,
     prompt: Optional[str],
     options: RenderOptions,
-    config: Dict[str, object],
+    config: Dict[str, Any],
     api_key: Optional[str],
     image_model: Optional[str] = None,
+    aspect_ratio: Optional[str] = None,
 ) -> Optional[PILImage.Image]:
+    from .gemini import DEFAULT_IMAGE_MODEL, GeminiNotConfigured, generate_background_image
+
     if not prompt:
         return None
 
-    gemini_cfg = config.get("gemini", {}) if isinstance(config, dict) else {}
+    gemini_cfg = config["gemini"]
     model_name = image_model or gemini_cfg.get("image_model", DEFAULT_IMAGE_MODEL)
-    aspect_ratio = _aspect_ratio_string(options.width, options.height)
+    aspect_ratio = aspect_ratio or _aspect_ratio_string(options.width, options.height)
 
     if not api_key:
-        _emit_warning_once(ctx, "gemini-missing", "Gemini API 키가 없어 배경 이미지는 그라데이션으로 대체됩니다.")
+        _warn_gemini_missing(ctx)
         return None
 
+    cache_key = (prompt, aspect_ratio, str(model_name))
+    cache_file = _background_cache_file(cache_key) if gemini_cfg.get("cache", True) else None
+    cached = _cached_background(cache_key, cache_file)
+    if cached is not None:
+        return cached
+
     try:
-        return generate_background_image(
+        image = generate_background_image(
             prompt=prompt,
             aspect_ratio=aspect_ratio,
             model_name=model_name,
             api_key=api_key,
+            rate_limiter=_rate_limiter(ctx, gemini_cfg),
         )
+        _store_background(cache_key, cache_file, image)
+        return image
     except GeminiNotConfigured:
-        _emit_warning_once(ctx, "gemini-missing", "Gemini API 키가 없어 배경 이미지는 그라데이션으로 대체됩니다.")
+        _warn_gemini_missing(ctx)
     except Exception as err:  # pragma: no cover - network variability
         _emit_warning_once(
             ctx,
@@ -590,13 +928,134 @@ def _maybe_generate_background(
     return None
 
 
+def _generate_backgrounds_batch(
+    ctx: click.Context,
+    prompts: List[str],
+    *,
+    config: Dict[str, Any],
+    api_key: str,
+    aspect_ratio: str,
+) -> List[Optional[PILImage.Image]]:
+    """Resolve backgrounds for `prompts`, sending only uncached prompts as one Gemini batch job."""
+    from .gemini import DEFAULT_IMAGE_MODEL, GeminiNotConfigured, generate_background_images_batch
+
+    gemini_cfg = config["gemini"]
+    model_name = str(gemini_cfg.get("image_model", DEFAULT_IMAGE_MODEL))
+    use_disk = gemini_cfg.get("cache", True)
+    timeout = _int_setting(gemini_cfg.get("batch_timeout", 3600), "gemini.batch_timeout", minimum=0)
+
+    resolved: Dict[str, Optional[PILImage.Image]] = {}
+    missing: List[str] = []
+    for prompt in dict.fromkeys(prompts):
+        cache_key = (prompt, aspect_ratio, model_name)
+        resolved[prompt] = _cached_background(cache_key, _background_cache_file(cache_key) if use_disk else None)
+        if resolved[prompt] is None:
+            missing.append(prompt)
+
+    if missing:
+        try:
+            images = generate_background_images_batch(
+                missing, aspect_ratio=aspect_ratio, model_name=model_name, api_key=api_key, timeout=timeout or None
+            )
+        except GeminiNotConfigured:
+            _warn_gemini_missing(ctx)
+            images = [None] * len(missing)
+        except Exception as err:  # pragma: no cover - network variability
+            _emit_warning_once(
+                ctx,
+                "gemini-background-failed",
+                f"Gemini 배경 이미지 생성 실패: {err}. 그라데이션으로 대체합니다.",
+            )
+            images = [None] * len(missing)
+        for prompt, image in zip(missing, images):
+            if image is not None:
+                cache_key = (prompt, aspect_ratio, model_name)
+                _store_background(cache_key, _background_cache_file(cache_key) if use_disk else None, image)
+            resolved[prompt] = image
+
+    return [resolved[prompt] for prompt in prompts]
+
+
+def _cached_background(key: Tuple[str, str, str], cache_file: Optional[Path]) -> Optional[PILImage.Image]:
+    with _BACKGROUND_CACHE_LOCK:
+        cached = _BACKGROUND_CACHE.get(key)
+        if cached is not None:
+            _BACKGROUND_CACHE.move_to_end(key)
+            return cached
+    if cache_file is not None:
+        cached = _read_cached_background(cache_file)
+        if cached is not None:
+            _remember_background(key, cached)
+    return cached
+
+
+def _store_background(key: Tuple[str, str, str], cache_file: Optional[Path], image: PILImage.Image) -> None:
+    _remember_background(key, image)
+    if cache_file is not None:
+        _write_cached_background(cache_file, image)
+
+
+def _remember_background(key: Tuple[str, str, str], image: PILImage.Image) -> None:
+    with _BACKGROUND_CACHE_LOCK:
+        _BACKGROUND_CACHE[key] = image
+        _BACKGROUND_CACHE.move_to_end(key)
+        while len(_BACKGROUND_CACHE) > _BACKGROUND_CACHE_SIZE:
+            _BACKGROUND_CACHE.popitem(last=False)
+
+
+def _rate_limiter(ctx: click.Context, gemini_cfg: Dict[str, Any]) -> Optional[RateLimiter]:
+    """Return the run-wide limiter for `gemini.rpm`, or None when unlimited (0)."""
+    from .gemini import RateLimiter
+
+    limiter = ctx.obj.get("_rate_limiter")
+    if limiter is None:
+        rpm = _int_setting(gemini_cfg.get("rpm", 0), "gemini.rpm", minimum=0)
+        if not rpm:
+            return None
+        limiter = ctx.obj.setdefault("_rate_limiter", RateLimiter(rpm))
+    return limiter
+
+
+def _background_cache_file(key: Tuple[str, str, str]) -> Path:
+    digest = hashlib.sha256("|".join(key).encode("utf-8")).hexdigest()
+    return get_cache_dir() / "backgrounds" / f"{digest}.png"
+
+
+def _read_cached_background(path: Path) -> Optional[PILImage.Image]:
+    from PIL import Image as PILImage
+
+    try:
+        with PILImage.open(path) as image:
+            return image.convert("RGB")
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cached_background(path: Path, image: PILImage.Image) -> None:
+    """Best-effort atomic write so concurrent fetchers never see a partial file."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        image.save(tmp_path, format="PNG")
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=256)
 def _aspect_ratio_string(width: int, height: int) -> str:
     gcd = math.gcd(width, height) or 1
     return f"{width // gcd}:{height // gcd}"
 
 
+def _warn_gemini_missing(ctx: click.Context) -> None:
+    _emit_warning_once(ctx, "gemini-missing", "Gemini API 키가 없어 배경 이미지는 그라데이션으로 대체됩니다.")
+
+
 def _emit_warning_once(ctx: click.Context, key: str, message: str) -> None:
-    store = ctx.obj.setdefault("_warnings", set())
+    store = ctx.obj.get("_warnings")
+    if store is None:
+        store = ctx.obj.setdefault("_warnings", set())
     if key in store:
         return
     store.add(key)
@@ -4,15 +4,21 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 
 CONFIG_ENV_VAR = "CARDNEWS_CONFIG_PATH"
+CACHE_ENV_VAR = "CARDNEWS_CACHE_DIR"
 PACKAGE_ROOT = Path(__file__).resolve().parent.parent
 DEFAULT_CONFIG_FILE = "config.yaml"
 LEGACY_CONFIG_PATH = Path.home() / ".config" / "cardnews" / DEFAULT_CONFIG_FILE
 
+# libyaml-backed loader/dumper when PyYAML was built with it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+_YAML_CACHE: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
 DEFAULT_CONFIG: Dict[str, Any] = {
     "fonts": {
         "title": {
@@ -32,10 +38,24 @@ DEFAULT_CONFIG: Dict[str, Any] = {
         "width": 1080,
         "height": 1080,
         "overlay": True,
+        "resample": "auto",
+    },
+    "output": {
+        "jpeg_quality": 75,
+        "jpeg_optimize": True,
+        "jpeg_progressive": True,
+        "png_compress_level": 6,
+        "webp_quality": 82,
+        "webp_method": 4,
     },
     "gemini": {
         "model": "nanobanana",
         "image_model": "nanobanana-image",
+        "concurrency": 4,
+        "rpm": 0,
+        "cache": True,
+        "batch_mode": False,
+        "batch_timeout": 3600,
     },
     "brand_card": {
         "overlay": True,
@@ -65,6 +85,21 @@ def _get_config_path() -> Path:
 CONFIG_PATH = _get_config_path()
 
 
+def get_cache_dir() -> Path:
+    """Return the directory for cached Gemini output (`$CARDNEWS_CACHE_DIR` or the XDG cache dir)."""
+    override = os.environ.get(CACHE_ENV_VAR)
+    if override:
+        return Path(override).expanduser()
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache).expanduser() if xdg_cache else Path.home() / ".cache"
+    return base / "cardnews"
+
+
+def default_config() -> Dict[str, Any]:
+    """Return a fresh, mutable copy of the default configuration."""
+    return _clone_dict(DEFAULT_CONFIG)
+
+
 def load_config() -> Dict[str, Any]:
     """Load configuration from disk, falling back to defaults."""
     data = _load_yaml(CONFIG_PATH)
@@ -72,47 +107,85 @@ def load_config() -> Dict[str, Any]:
         legacy = _load_yaml(LEGACY_CONFIG_PATH)
         data = legacy if legacy is not None else {}
 
-    return _deep_merge_dicts(DEFAULT_CONFIG, data)
+    merged = _deep_merge_dicts(DEFAULT_CONFIG, data)
+    _validate_sections(DEFAULT_CONFIG, merged)
+    return merged
 
 
 def save_config(config: Dict[str, Any]) -> None:
-    """Persist configuration to disk."""
+    """Persist configuration to disk atomically, so concurrent readers never see a partial file."""
     CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with CONFIG_PATH.open("w", encoding="utf-8") as fh:
-        yaml.safe_dump(config, fh, sort_keys=True, allow_unicode=True)
+    _YAML_CACHE.pop(CONFIG_PATH, None)
+    tmp_path = CONFIG_PATH.with_name(f"{CONFIG_PATH.name}.{os.getpid()}.tmp")
+    with tmp_path.open("w", encoding="utf-8") as fh:
+        yaml.dump(config, fh, Dumper=_YAML_DUMPER, sort_keys=True, allow_unicode=True)
+    os.replace(tmp_path, CONFIG_PATH)
 
 
 def update_config(updates: Dict[str, Any]) -> Dict[str, Any]:
-    """Apply updates to the current configuration and save the result."""
+    """Apply updates to the current configuration and save the result; invalid results are never saved."""
     current = load_config()
     merged = _deep_merge_dicts(current, updates)
-    save_config(merged)
+    _validate_sections(DEFAULT_CONFIG, merged)
+    if merged != current or not CONFIG_PATH.exists():
+        save_config(merged)
     return merged
 
 
 def _load_yaml(path: Path) -> Optional[Dict[str, Any]]:
-    if not path.exists():
+    """Parse `path`, reusing the previous result while its mtime and size are unchanged."""
+    try:
+        stat = path.stat()
+    except OSError:
         return None
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _YAML_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
     try:
         with path.open("r", encoding="utf-8") as fh:
-            loaded = yaml.safe_load(fh) or {}
-            if isinstance(loaded, dict):
-                return loaded
-            raise RuntimeError(f"Invalid configuration structure at {path}; expected a mapping.")
+            loaded = yaml.load(fh, Loader=_YAML_LOADER) or {}
     except yaml.YAMLError as err:
         raise RuntimeError(f"Invalid configuration at {path}: {err}") from err
+    if not isinstance(loaded, dict):
+        raise RuntimeError(f"Invalid configuration structure at {path}; expected a mapping.")
+    _YAML_CACHE[path] = (stamp, loaded)
+    return loaded
+
+
+def _validate_sections(defaults: Dict[str, Any], data: Dict[str, Any], prefix: str = "") -> None:
+    """Ensure every section that defaults to a mapping is still a mapping after merging."""
+    for key, default in defaults.items():
+        if not isinstance(default, dict):
+            continue
+        value = data.get(key)
+        if not isinstance(value, dict):
+            raise RuntimeError(f"Invalid configuration: '{prefix}{key}' must be a mapping.")
+        _validate_sections(default, value, f"{prefix}{key}.")
 
 
 def _deep_merge_dicts(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-    """Recursively merge two dictionaries without mutating inputs."""
-    result: Dict[str, Any] = dict(base)
-    for key, value in override.items():
-        if (
-            key in result
-            and isinstance(result[key], dict)
-            and isinstance(value, dict)
-        ):
-            result[key] = _deep_merge_dicts(result[key], value)
-        else:
-            result[key] = value
+    """Recursively merge two dictionaries without mutating inputs; only shared keys recurse.
+
+    A section left empty in YAML (all children commented out) loads as None and is treated as `{}`.
+    """
+    result: Dict[str, Any] = {**base, **override}
+    for key in base.keys() & override.keys():
+        base_value, value = base[key], override[key]
+        if isinstance(base_value, dict) and value is None:
+            value = {}
+        if isinstance(base_value, dict) and isinstance(value, dict):
+            result[key] = _deep_merge_dicts(base_value, value)
+    return result
+
+
+def _clone_dict(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy nested dicts/lists of plain values; cheaper than copy.deepcopy."""
+    result: Dict[str, Any] = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            value = _clone_dict(value)
+        elif isinstance(value, list):
+            value = list(value)
+        result[key] = value
     return result
@@ -4,24 +4,49 @@ from __future__ import annotations
 
 import json
 import os
+import random
+import threading
+import time
 from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from PIL import Image
 
-try:  # pragma: no cover - import guarded for optional dependency
-    from google import genai
-    from google.genai import types
-except ImportError:  # pragma: no cover - handled gracefully at runtime
-    genai = None  # type: ignore[assignment]
-    types = None  # type: ignore[assignment]
-
 DEFAULT_TEXT_MODEL = "nanobanana"
 DEFAULT_IMAGE_MODEL = "nanobanana-image"
 ENV_API_KEY = "GEMINI_API_KEY"
 
+RATE_LIMIT_ATTEMPTS = 3
+RATE_LIMIT_BACKOFF = 1.0
+RATE_LIMIT_JITTER = 0.25
+BATCH_POLL_INTERVAL = 30.0
+BATCH_TIMEOUT = 3600.0
+_BATCH_DONE_STATES = frozenset(
+    {"JOB_STATE_SUCCEEDED", "JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED"}
+)
+
+# Structured-output schema so Gemini returns the card array directly, without prose or fences.
+_CARDS_SCHEMA: Dict[str, Any] = {
+    "type": "ARRAY",
+    "items": {
+        "type": "OBJECT",
+        "properties": {
+            "title": {"type": "STRING"},
+            "subtitle": {"type": "STRING"},
+            "image_prompt": {"type": "STRING"},
+        },
+        "required": ["title", "subtitle", "image_prompt"],
+    },
+}
+
+_FALLBACK_TEMPLATES = (
+    ("오늘의 통찰", "{topic}에 관한 짧은 생각", "Nanobanana gradient, modern, {topic}"),
+    ("하루 한 걸음", "{topic} 실천 팁", "Nanobanana pastel blend, inspirational, {topic}"),
+    ("기억해둘 말", "{topic}에 대한 핵심 메시지", "Nanobanana glow, vibrant, {topic}"),
+)
+
 MODEL_ALIASES = {
     "nanobanana": "gemini-2.0-flash",
     "nanobanana-image": "gemini-2.5-flash-image",
@@ -32,6 +57,23 @@ class GeminiNotConfigured(RuntimeError):
     """Raised when Gemini integration is requested but not configured."""
 
 
+class RateLimiter:
+    """Space calls evenly so that at most `per_minute` start in any minute, across threads."""
+
+    def __init__(self, per_minute: int) -> None:
+        self._interval = 60.0 / per_minute
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
 def get_api_key() -> Optional[str]:
     """Return the Gemini API key, attempting to load from a `.env` file if needed."""
     key = os.environ.get(ENV_API_KEY)
@@ -58,14 +100,18 @@ def generate_cards(
 ) -> List[Dict[str, Any]]:
     """Return card content suggestions, falling back to canned templates on failure."""
     key = api_key or get_api_key()
-    if key and genai is not None and types is not None:
+    if key:
         try:
+            _, types = _load_sdk()
             client = _get_client(key)
             resolved_model = _resolve_model_name(model_name)
             response = client.models.generate_content(
                 model=resolved_model,
                 contents=[_build_text_prompt(topic=topic, count=count, style=style)],
-                config=types.GenerateContentConfig(response_mime_type="application/json"),
+                config=types.GenerateContentConfig(
+                    response_mime_type="application/json",
+                    response_schema=_CARDS_SCHEMA,
+                ),
             )
             payload = _extract_text(response)
             if payload:
@@ -84,30 +130,98 @@ def generate_background_image(
     aspect_ratio: str,
     model_name: str = DEFAULT_IMAGE_MODEL,
     api_key: Optional[str] = None,
+    rate_limiter: Optional[RateLimiter] = None,
 ) -> Image.Image:
-    """Generate a Nanobanana-style background image with Gemini."""
+    """Generate a Nanobanana-style background image with Gemini.
+
+    Requests rejected with HTTP 429 are retried with jittered exponential backoff.
+    """
     key = api_key or get_api_key()
     if not key:
         raise GeminiNotConfigured("Gemini API key is not configured. Set GEMINI_API_KEY or .env entry.")
-    if genai is None or types is None:
-        raise GeminiNotConfigured("google-genai package is not available; install google-genai.")
+    _, types = _load_sdk()
 
     client = _get_client(key)
     resolved_model = _resolve_model_name(model_name)
-    response = client.models.generate_content(
-        model=resolved_model,
-        contents=[_build_image_prompt(prompt)],
-        config=types.GenerateContentConfig(
-            image_config=types.ImageConfig(aspect_ratio=aspect_ratio),
-        ),
-    )
+    for attempt in range(RATE_LIMIT_ATTEMPTS):
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        try:
+            response = client.models.generate_content(
+                model=resolved_model,
+                contents=[_build_image_prompt(prompt)],
+                config=types.GenerateContentConfig(
+                    image_config=types.ImageConfig(aspect_ratio=aspect_ratio),
+                ),
+            )
+            break
+        except Exception as err:  # pragma: no cover - remote API variances
+            if attempt + 1 == RATE_LIMIT_ATTEMPTS or not _is_rate_limited(err):
+                raise
+            jitter = random.uniform(1 - RATE_LIMIT_JITTER, 1 + RATE_LIMIT_JITTER)
+            time.sleep(RATE_LIMIT_BACKOFF * (2**attempt) * jitter)
 
-    for part in _iter_parts(response):
-        inline = getattr(part, "inline_data", None)
-        if inline and getattr(inline, "data", None):
-            image = Image.open(BytesIO(inline.data))
-            return image.convert("RGB")
-    raise RuntimeError("Gemini response did not include image data.")
+    image = _first_image(response)
+    if image is None:
+        raise RuntimeError("Gemini response did not include image data.")
+    return image
+
+
+def generate_background_images_batch(
+    prompts: Sequence[str],
+    *,
+    aspect_ratio: str,
+    model_name: str = DEFAULT_IMAGE_MODEL,
+    api_key: Optional[str] = None,
+    poll_interval: float = BATCH_POLL_INTERVAL,
+    timeout: Optional[float] = BATCH_TIMEOUT,
+) -> List[Optional[Image.Image]]:
+    """Generate backgrounds through Gemini Batch Mode (half price, delivered asynchronously).
+
+    Blocks until the job finishes, or cancels it and raises TimeoutError once `timeout` seconds
+    pass (None waits for the whole batch window). Entries whose response carries no image are None.
+    """
+    key = api_key or get_api_key()
+    if not key:
+        raise GeminiNotConfigured("Gemini API key is not configured. Set GEMINI_API_KEY or .env entry.")
+    _load_sdk()
+
+    client = _get_client(key)
+    requests = [
+        {
+            "contents": [{"role": "user", "parts": [{"text": _build_image_prompt(prompt)}]}],
+            "config": {"image_config": {"aspect_ratio": aspect_ratio}},
+            "metadata": {"key": str(index)},
+        }
+        for index, prompt in enumerate(prompts)
+    ]
+    job = client.batches.create(
+        model=_resolve_model_name(model_name),
+        src=requests,
+        config={"display_name": "cardnews-backgrounds"},
+    )
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while _job_state(job) not in _BATCH_DONE_STATES:
+        if deadline is not None and time.monotonic() >= deadline:
+            try:
+                client.batches.cancel(name=job.name)
+            except Exception:  # pragma: no cover - best effort, the job expires on its own
+                pass
+            raise TimeoutError(f"Gemini batch job {job.name} did not finish within {timeout:g}s; cancelled.")
+        delay = poll_interval if deadline is None else min(poll_interval, max(deadline - time.monotonic(), 0.0))
+        time.sleep(delay)
+        job = client.batches.get(name=job.name)
+    state = _job_state(job)
+    if state != "JOB_STATE_SUCCEEDED":
+        raise RuntimeError(f"Gemini batch job finished with {state}: {getattr(job, 'error', None)}")
+
+    responses = getattr(getattr(job, "dest", None), "inlined_responses", None) or []
+    images: List[Optional[Image.Image]] = [None] * len(prompts)
+    for position, item in enumerate(responses):
+        index = _response_index(item, position, len(responses) == len(prompts))
+        if index is not None and 0 <= index < len(prompts):
+            images[index] = _first_image(getattr(item, "response", None))
+    return images
 
 
 def _build_text_prompt(topic: str, count: int, style: Optional[str]) -> str:
@@ -142,6 +256,37 @@ def _extract_text(response: Any) -> Optional[str]:
     return None
 
 
+def _first_image(response: Any) -> Optional[Image.Image]:
+    for part in _iter_parts(response):
+        inline = getattr(part, "inline_data", None)
+        if inline and getattr(inline, "data", None):
+            image = Image.open(BytesIO(inline.data))
+            image.load()
+            # JPEG responses already decode to RGB; `convert` would copy the frame for nothing.
+            return image if image.mode == "RGB" else image.convert("RGB")
+    return None
+
+
+def _response_index(item: Any, position: int, complete: bool) -> Optional[int]:
+    """Match a batch response to its prompt by the request key, or by position only when none went missing."""
+    key = (getattr(item, "metadata", None) or {}).get("key")
+    if key is not None:
+        try:
+            return int(key)
+        except (TypeError, ValueError):
+            return None
+    return position if complete else None
+
+
+def _job_state(job: Any) -> str:
+    state = getattr(job, "state", None)
+    return str(getattr(state, "name", state))
+
+
+def _is_rate_limited(err: Exception) -> bool:
+    return getattr(err, "code", None) == 429 or "RESOURCE_EXHAUSTED" in str(err)
+
+
 def _iter_parts(response: Any) -> Iterable[Any]:
     for candidate in getattr(response, "candidates", []) or []:
         content = getattr(candidate, "content", None)
@@ -160,22 +305,16 @@ def _normalise_item(item: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def _fallback_cards(topic: str, count: int, style: Optional[str]) -> List[Dict[str, Any]]:
-    templates = [
-        ("오늘의 통찰", "{topic}에 관한 짧은 생각", "Nanobanana gradient, modern, {topic}"),
-        ("하루 한 걸음", "{topic} 실천 팁", "Nanobanana pastel blend, inspirational, {topic}"),
-        ("기억해둘 말", "{topic}에 대한 핵심 메시지", "Nanobanana glow, vibrant, {topic}"),
+    # The templates only depend on `topic`, so format each once and cycle copies.
+    rendered = [
+        {
+            "title": title_tpl.format(topic=topic),
+            "subtitle": subtitle_tpl.format(topic=topic),
+            "image_prompt": prompt_tpl.format(topic=topic),
+        }
+        for title_tpl, subtitle_tpl, prompt_tpl in _FALLBACK_TEMPLATES
     ]
-    results: List[Dict[str, Any]] = []
-    for index in range(count):
-        title_tpl, subtitle_tpl, prompt_tpl = templates[index % len(templates)]
-        results.append(
-            {
-                "title": title_tpl.format(topic=topic, style=style or ""),
-                "subtitle": subtitle_tpl.format(topic=topic, style=style or ""),
-                "image_prompt": prompt_tpl.format(topic=topic, style=style or ""),
-            }
-        )
-    return results
+    return [dict(rendered[index % len(rendered)]) for index in range(count)]
 
 
 def _candidate_env_paths() -> Iterable[Path]:
@@ -209,18 +348,39 @@ def _resolve_model_name(model: str) -> str:
     return actual or model
 
 
-@lru_cache(maxsize=2)
+_CLIENT_LOCK = threading.Lock()
+
+
 def _get_client(api_key: str):  # pragma: no cover - thin wrapper
-    if genai is None:
-        raise GeminiNotConfigured("google-genai package is not available; install google-genai.")
+    """Return the process-wide client for this key so its HTTP connection pool is reused."""
+    with _CLIENT_LOCK:
+        return _create_client(api_key)
+
+
+@lru_cache(maxsize=2)
+def _create_client(api_key: str):  # pragma: no cover - thin wrapper
+    genai, _ = _load_sdk()
     return genai.Client(api_key=api_key)
 
 
+@lru_cache(maxsize=1)
+def _load_sdk() -> Tuple[Any, Any]:
+    """Import google-genai on first use; it is slow to import and only needed once a key is set."""
+    try:  # pragma: no cover - import guarded for optional dependency
+        from google import genai
+        from google.genai import types
+    except ImportError as err:  # pragma: no cover - handled gracefully at runtime
+        raise GeminiNotConfigured("google-genai package is not available; install google-genai.") from err
+    return genai, types
+
+
 __all__ = [
     "generate_cards",
     "generate_background_image",
+    "generate_background_images_batch",
     "get_api_key",
     "GeminiNotConfigured",
+    "RateLimiter",
     "DEFAULT_TEXT_MODEL",
     "DEFAULT_IMAGE_MODEL",
 ]
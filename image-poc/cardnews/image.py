@@ -4,28 +4,46 @@ from __future__ import annotations
 
 import hashlib
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 from PIL import Image, ImageDraw, ImageFilter, ImageFont
 
 Gradient = Sequence[Tuple[int, int, int]]
 
+_FALLBACK_FONTS = (
+    "Pretendard-Bold.otf",
+    "Pretendard-SemiBold.otf",
+    "Pretendard-Regular.otf",
+    "Pretendard.ttf",
+    "Pretendard.otf",
+    "Arial.ttf",
+    "arial.ttf",
+)
 
-@dataclass
+RESAMPLE_FILTERS = {
+    "lanczos": Image.LANCZOS,
+    "bicubic": Image.BICUBIC,
+    "bilinear": Image.BILINEAR,
+}
+
+
+@dataclass(frozen=True)
 class FontSpec:
     path: Optional[str]
     size: int
 
 
-@dataclass
+@dataclass(frozen=True)
 class RenderOptions:
     width: int = 1080
     height: int = 1080
     add_overlay: bool = True
     shadow: bool = True
+    resample: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class TextSpec:
     title: str
     subtitle: str
@@ -33,7 +51,7 @@ class TextSpec:
     subtitle_font: FontSpec
 
 
-@dataclass
+@dataclass(frozen=True)
 class TextBlock:
     text: str
     font: FontSpec
@@ -65,24 +83,18 @@ def create_card(
     target_size = (target, target)
 
     if background_image is not None:
-        background = ensure_square(background_image).resize(target_size, Image.LANCZOS)
+        background = fit_square(background_image, target_size, options.resample)
     elif background_path:
-        background = load_background(background_path, target_size)
+        background = load_background(background_path, target_size, options.resample)
     else:
         background = generate_prompt_gradient(prompt, target_size)
 
-    background = background.convert("RGBA")
-
-    if options.add_overlay:
-        overlay = Image.new("RGBA", background.size, (0, 0, 0, 96))
-        background = Image.alpha_composite(background, overlay)
+    canvas = _overlaid_canvas(background, (0, 0, 0, 96) if options.add_overlay else None)
 
     title_font = load_font(fonts[0])
     subtitle_font = load_font(fonts[1])
 
-    text_color = pick_text_color(background)
-
-    canvas = background.copy()
+    text_color = pick_text_color(canvas)
     draw = ImageDraw.Draw(canvas)
 
     _draw_text_block(
@@ -102,7 +114,40 @@ def create_card(
         shadow=options.shadow,
     )
 
-    return canvas.convert("RGB")
+    return _as_rgb(canvas)
+
+
+def _as_rgb(image: Image.Image) -> Image.Image:
+    """Convert to RGB only when needed; `convert` copies even when the mode already matches."""
+    return image if image.mode == "RGB" else image.convert("RGB")
+
+
+def _overlaid_canvas(
+    image: Image.Image,
+    overlay_color: Optional[Tuple[int, int, int, int]],
+) -> Image.Image:
+    """Return a new drawable canvas with an optional flat RGBA overlay blended on top."""
+    if image.mode != "RGB":
+        canvas = image.convert("RGBA")
+        if overlay_color:
+            canvas = Image.alpha_composite(canvas, Image.new("RGBA", canvas.size, overlay_color))
+        return canvas
+
+    if not overlay_color:
+        return image.copy()
+    # Opaque base + flat colour: the blend is a per-channel lookup, giving the same pixels as
+    # alpha_composite in one pass with no RGBA or mask buffers.
+    return image.point(_overlay_lut(tuple(overlay_color)))
+
+
+@lru_cache(maxsize=8)
+def _overlay_lut(overlay_color: Tuple[int, int, int, int]) -> List[int]:
+    alpha = overlay_color[3]
+    return [
+        (value * (255 - alpha) + channel * alpha + 127) // 255
+        for channel in overlay_color[:3]
+        for value in range(256)
+    ]
 
 
 def _split_paragraphs(text: str, font: ImageFont.ImageFont, max_width: int) -> List[str]:
@@ -120,30 +165,30 @@ def _split_paragraphs(text: str, font: ImageFont.ImageFont, max_width: int) -> L
     return lines
 
 
-def _lines_height(lines: Sequence[str], font: ImageFont.ImageFont, spacing: int) -> int:
-    if not lines:
+def _lines_height(heights: Sequence[int], spacing: int) -> int:
+    if not heights:
         return 0
-    heights = [text_height(font, line) for line in lines]
-    return sum(heights) + spacing * (len(lines) - 1)
+    return sum(heights) + spacing * (len(heights) - 1)
 
 
 def _draw_lines(
     draw: ImageDraw.ImageDraw,
     *,
     lines: Sequence[str],
+    heights: Sequence[int],
     font: ImageFont.ImageFont,
     start: Tuple[int, int],
     fill: Tuple[int, int, int],
     spacing: int,
     shadow: bool,
 ) -> None:
+    """Draw pre-wrapped lines, advancing by the heights already measured for layout."""
     x, y = start
-    for index, line in enumerate(lines):
+    for line, height in zip(lines, heights):
         if shadow:
             draw.text((x + 2, y + 2), line, font=font, fill=_shadow_color(fill))
         draw.text((x, y), line, font=font, fill=fill)
-        if index < len(lines) - 1:
-            y += text_height(font, line) + spacing
+        y += height + spacing
 
 
 def create_brand_card(
@@ -158,22 +203,19 @@ def create_brand_card(
     font_specs: Optional[Mapping[str, FontSpec]] = None,
     overlay_color: Optional[Tuple[int, int, int, int]] = (255, 255, 255, 48),
     shadow: bool = False,
+    resample: Optional[str] = None,
 ) -> Image.Image:
     """Render a brand layout card using a supplied background image."""
 
     target_size = (size, size)
     if background_image is not None:
-        base = ensure_square(background_image).resize(target_size, Image.LANCZOS)
+        base = fit_square(background_image, target_size, resample)
     elif background_path:
-        base = load_background(background_path, target_size)
+        base = load_background(background_path, target_size, resample)
     else:
         base = Image.new("RGB", target_size, (236, 236, 236))
 
-    canvas = base.convert("RGBA")
-
-    if overlay_color:
-        overlay = Image.new("RGBA", canvas.size, overlay_color)
-        canvas = Image.alpha_composite(canvas, overlay)
+    canvas = _overlaid_canvas(base, overlay_color)
 
     defaults = _default_brand_card_fonts(size)
     if font_specs:
@@ -182,7 +224,7 @@ def create_brand_card(
 
     fonts = {key: load_font(spec) for key, spec in defaults.items()}
 
-    text_color = pick_text_color(canvas.convert("RGB"))
+    text_color = pick_text_color(canvas)
 
     margin = max(20, size // 14)
     max_text_width = canvas.width - (margin * 2)
@@ -195,8 +237,10 @@ def create_brand_card(
     title_lines = _split_paragraphs(title_text, fonts["title"], max_text_width)
     subtitle_lines = _split_paragraphs(subtitle_text, fonts["subtitle"], max_text_width)
 
-    title_height = _lines_height(title_lines, fonts["title"], title_spacing)
-    subtitle_height = _lines_height(subtitle_lines, fonts["subtitle"], subtitle_spacing)
+    title_heights = [text_height(fonts["title"], line) for line in title_lines]
+    subtitle_heights = [text_height(fonts["subtitle"], line) for line in subtitle_lines]
+    title_height = _lines_height(title_heights, title_spacing)
+    subtitle_height = _lines_height(subtitle_heights, subtitle_spacing)
 
     footer_height = text_height(fonts["footer"], footer_text) if footer_text else 0
     footer_bottom = canvas.height - margin
@@ -234,6 +278,7 @@ def create_brand_card(
         _draw_lines(
             draw,
             lines=title_lines,
+            heights=title_heights,
             font=fonts["title"],
             start=(margin, title_top),
             fill=text_color,
@@ -245,6 +290,7 @@ def create_brand_card(
         _draw_lines(
             draw,
             lines=subtitle_lines,
+            heights=subtitle_heights,
             font=fonts["subtitle"],
             start=(margin, subtitle_top),
             fill=text_color,
@@ -261,7 +307,7 @@ def create_brand_card(
             draw.text((footer_x + 2, footer_y + 2), footer_text, font=footer_font, fill=_shadow_color(text_color))
         draw.text((footer_x, footer_y), footer_text, font=footer_font, fill=text_color)
 
-    return canvas.convert("RGB")
+    return _as_rgb(canvas)
 
 
 def draw_text_blocks(
@@ -281,7 +327,7 @@ def draw_text_blocks(
             continue
 
         font = load_font(block.font)
-        fill = block.fill or default_fill or pick_text_color(canvas)
+        fill = block.fill or default_fill or pick_text_color(_region(canvas, block.box))
 
         _draw_text_block(
             draw,
@@ -295,11 +341,26 @@ def draw_text_blocks(
     return canvas
 
 
-def load_background(path: str, size: Tuple[int, int]) -> Image.Image:
+def _region(image: Image.Image, box: Tuple[int, int, int, int]) -> Image.Image:
+    """Crop `box` clamped to the image bounds, or the whole image if nothing remains."""
+    x0, y0 = max(0, box[0]), max(0, box[1])
+    x1, y1 = min(image.width, box[2]), min(image.height, box[3])
+    if x1 <= x0 or y1 <= y0:
+        return image
+    return image.crop((x0, y0, x1, y1))
+
+
+def load_background(path: str, size: Tuple[int, int], resample: Optional[str] = None) -> Image.Image:
     """Load a background image from disk and resize it."""
     image = Image.open(path)
-    image = ensure_square(image.convert("RGB"))
-    return image.resize(size, Image.LANCZOS)
+    # Let JPEG decode at 1/2, 1/4 or 1/8 scale when the centre square still covers `size`.
+    width, height = image.size
+    edge = min(width, height)
+    target = max(size)
+    if edge > target:
+        image.draft("RGB", (-(-width * target // edge), -(-height * target // edge)))
+    # Crop before converting so the mode conversion only touches the pixels that are kept.
+    return fit_square(_as_rgb(ensure_square(image)), size, resample)
 
 
 def generate_prompt_gradient(prompt: Optional[str], size: Tuple[int, int]) -> Image.Image:
@@ -310,32 +371,41 @@ def generate_prompt_gradient(prompt: Optional[str], size: Tuple[int, int]) -> Im
 
 def load_font(spec: FontSpec) -> ImageFont.FreeTypeFont:
     """Load a font from the given spec, falling back to a default font."""
-    if spec.path:
+    return _load_font(spec.path, spec.size)
+
+
+@lru_cache(maxsize=64)
+def _load_font(path: Optional[str], size: int) -> ImageFont.FreeTypeFont:
+    """Open each (path, size) pair once per process; fonts are only read while drawing."""
+    if path:
         try:
-            return ImageFont.truetype(spec.path, spec.size)
+            return ImageFont.truetype(path, size)
         except OSError:
             pass
-    fallback_fonts = [
-        "Pretendard-Bold.otf",
-        "Pretendard-SemiBold.otf",
-        "Pretendard-Regular.otf",
-        "Pretendard.ttf",
-        "Pretendard.otf",
-        "Arial.ttf",
-        "arial.ttf",
-    ]
-    for candidate in fallback_fonts:
+    fallback = _fallback_font_path()
+    if fallback is not None:
+        return ImageFont.truetype(fallback, size)
+    return ImageFont.load_default()
+
+
+@lru_cache(maxsize=1)
+def _fallback_font_path() -> Optional[str]:
+    """Probe the fallback list once; later sizes go straight to the font that opened."""
+    for candidate in _FALLBACK_FONTS:
         try:
-            return ImageFont.truetype(candidate, spec.size)
+            ImageFont.truetype(candidate, 12)
         except OSError:
             continue
-    return ImageFont.load_default()
+        return candidate
+    return None
 
 
 def pick_text_color(image: Image.Image) -> Tuple[int, int, int]:
     """Pick a readable text color based on average luminance."""
-    grayscale = image.convert("L")
-    sample = grayscale.resize((10, 10), Image.BOX)
+    if image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+    # Box-average first so the luminance conversion runs on 100 pixels, not the whole region.
+    sample = image.resize((10, 10), Image.BOX).convert("L")
     avg = sum(sample.getdata()) / 100.0
     return (20, 20, 20) if avg > 160 else (240, 240, 240)
 
@@ -343,47 +413,44 @@ def pick_text_color(image: Image.Image) -> Tuple[int, int, int]:
 def linear_gradient(size: Tuple[int, int], colors: Gradient) -> Image.Image:
     """Create a vertical linear gradient with optional blur blend."""
     width, height = size
-    base = Image.new("RGB", size)
-    draw = ImageDraw.Draw(base)
+    # Every row is a single colour, so build (and blur/blend) a one-pixel column and stretch it once.
     top, bottom = colors[0], colors[-1]
+    rows = bytearray()
     for y in range(height):
         ratio = y / max(height - 1, 1)
-        r = int(top[0] * (1 - ratio) + bottom[0] * ratio)
-        g = int(top[1] * (1 - ratio) + bottom[1] * ratio)
-        b = int(top[2] * (1 - ratio) + bottom[2] * ratio)
-        draw.line([(0, y), (width, y)], fill=(r, g, b))
+        rows += bytes(int(top[c] * (1 - ratio) + bottom[c] * ratio) for c in range(3))
+    column = Image.frombytes("RGB", (1, height), bytes(rows))
     if len(colors) > 2:
-        overlay = Image.new("RGB", size)
-        overlay_draw = ImageDraw.Draw(overlay)
+        rows = bytearray(3 * height)
         steps = len(colors) - 1
         for index, (start, end) in enumerate(zip(colors[:-1], colors[1:])):
             y0 = int(height * index / steps)
             y1 = int(height * (index + 1) / steps)
             for y in range(y0, y1):
                 ratio = (y - y0) / max(y1 - y0, 1)
-                r = int(start[0] * (1 - ratio) + end[0] * ratio)
-                g = int(start[1] * (1 - ratio) + end[1] * ratio)
-                b = int(start[2] * (1 - ratio) + end[2] * ratio)
-                overlay_draw.line([(0, y), (width, y)], fill=(r, g, b))
+                rows[3 * y : 3 * y + 3] = bytes(int(start[c] * (1 - ratio) + end[c] * ratio) for c in range(3))
+        overlay = Image.frombytes("RGB", (1, height), bytes(rows))
         overlay = overlay.filter(ImageFilter.GaussianBlur(radius=height / 12))
-        base = Image.blend(base, overlay, alpha=0.4)
-    return base
+        column = Image.blend(column, overlay, alpha=0.4)
+    return column.resize((width, height), Image.NEAREST)
+
+
+_GRADIENT_PALETTE = (
+    (255, 92, 87),
+    (255, 149, 0),
+    (255, 204, 0),
+    (76, 217, 100),
+    (90, 200, 250),
+    (88, 86, 214),
+    (255, 45, 85),
+    (142, 142, 147),
+)
 
 
 def _prompt_to_gradient(prompt: str) -> Gradient:
-    palette = [
-        (255, 92, 87),
-        (255, 149, 0),
-        (255, 204, 0),
-        (76, 217, 100),
-        (90, 200, 250),
-        (88, 86, 214),
-        (255, 45, 85),
-        (142, 142, 147),
-    ]
+    # SHA-256 stays so existing prompts keep the colours they have always rendered with.
     digest = hashlib.sha256(prompt.encode("utf-8")).digest()
-    picks = [digest[i] % len(palette) for i in range(3)]
-    return [palette[idx] for idx in picks]
+    return [_GRADIENT_PALETTE[byte % len(_GRADIENT_PALETTE)] for byte in digest[:3]]
 
 
 def _draw_text_block(
@@ -398,27 +465,32 @@ def _draw_text_block(
         return
 
     max_width = box[2] - box[0] - 80
-    lines = wrap_text(text, font, max_width)
+    widths: Dict[str, float] = {}
+    lines = _wrap_text(text, font, max_width, widths)
     if not lines:
         return
 
     line_heights = [text_height(font, line) for line in lines]
     total_height = sum(line_heights) + max(0, (len(lines) - 1) * 12)
     x0, y0, x1, y1 = box
-    start_y = y0 + max(0, (y1 - y0 - total_height) // 2)
+    y = y0 + max(0, (y1 - y0 - total_height) // 2)
 
-    for idx, line in enumerate(lines):
-        width = text_width(font, line)
-        line_height = line_heights[idx]
+    for line, line_height in zip(lines, line_heights):
+        width = _measure(font, line, widths)
         x = x0 + (x1 - x0 - width) / 2
-        y = start_y + sum(line_heights[:idx]) + idx * 12
         if shadow:
             draw.text((x + 2, y + 2), line, font=font, fill=_shadow_color(fill))
         draw.text((x, y), line, font=font, fill=fill)
+        y += line_height + 12
 
 
 def wrap_text(text: str, font: ImageFont.ImageFont, max_width: int) -> List[str]:
     """Wrap text to fit in a pixel width, supporting CJK languages."""
+    return _wrap_text(text, font, max_width, {})
+
+
+def _wrap_text(text: str, font: ImageFont.ImageFont, max_width: int, widths: Dict[str, float]) -> List[str]:
+    """`wrap_text` that records every measured width in `widths` for the caller to reuse."""
     if not text:
         return []
 
@@ -432,10 +504,10 @@ def wrap_text(text: str, font: ImageFont.ImageFont, max_width: int) -> List[str]
         separator = " " if has_spaces and current else ""
         candidate = current + separator + token if has_spaces else current + token
 
-        if current and text_width(font, candidate) > max_width:
+        if current and _measure(font, candidate, widths) > max_width:
             lines.append(current)
             current = token
-            if text_width(font, current) > max_width:
+            if _measure(font, current, widths) > max_width:
                 lines.append(_truncate_text(token, font, max_width))
                 current = ""
         else:
@@ -457,6 +529,13 @@ def _truncate_text(token: str, font: ImageFont.ImageFont, max_width: int) -> str
     return accum or token
 
 
+def _measure(font: ImageFont.ImageFont, text: str, widths: Dict[str, float]) -> float:
+    width = widths.get(text)
+    if width is None:
+        width = widths[text] = text_width(font, text)
+    return width
+
+
 def text_width(font: ImageFont.ImageFont, text: str) -> float:
     try:
         return font.getlength(text)
@@ -475,6 +554,22 @@ def _shadow_color(color: Tuple[int, int, int]) -> Tuple[int, int, int, int]:
     return (max(0, r - 120), max(0, g - 120), max(0, b - 120), 180)
 
 
+def fit_square(image: Image.Image, size: Tuple[int, int], resample: Optional[str] = None) -> Image.Image:
+    """Center-crop to a square and resize, skipping the resample when already at `size`.
+
+    `resample` names a RESAMPLE_FILTERS entry. By default near-size downsamples (at most 1.5x the
+    target) use BILINEAR; upscales and larger reductions keep LANCZOS.
+    """
+    square = ensure_square(image)
+    if square.size == size:
+        return square
+    if resample:
+        resample_filter = RESAMPLE_FILTERS[resample]
+    else:
+        resample_filter = Image.BILINEAR if max(size) < square.width <= max(size) * 1.5 else Image.LANCZOS
+    return square.resize(size, resample_filter)
+
+
 def ensure_square(image: Image.Image) -> Image.Image:
     """Crop the image to a centered square."""
     width, height = image.size
@@ -490,6 +585,7 @@ def ensure_square(image: Image.Image) -> Image.Image:
 
 __all__ = [
     "FontSpec",
+    "RESAMPLE_FILTERS",
     "RenderOptions",
     "TextSpec",
     "TextBlock",
@@ -500,5 +596,6 @@ __all__ = [
     "load_background",
     "wrap_text",
     "ensure_square",
+    "fit_square",
     "pick_text_color",
 ]
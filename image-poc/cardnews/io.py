@@ -5,7 +5,12 @@ from __future__ import annotations
 import csv
 import json
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+try:  # pragma: no cover - optional faster JSON parser
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json is used instead
+    orjson = None  # type: ignore[assignment]
 
 
 def load_card(path: str) -> Dict[str, str]:
@@ -13,23 +18,38 @@ def load_card(path: str) -> Dict[str, str]:
     data = _load_json(Path(path))
     if not isinstance(data, dict):
         raise ValueError("Card definition must be a JSON object with title/subtitle/image_prompt.")
-    return {k: str(v) for k, v in data.items() if v is not None}
+    return _card_fields(data)
 
 
 def load_cards(path: str) -> List[Dict[str, str]]:
     """Load multiple cards from JSON array or CSV."""
+    return list(iter_cards(path))
+
+
+def iter_cards(path: str) -> Iterator[Dict[str, str]]:
+    """Yield card definitions one at a time; CSV rows are streamed instead of read up front."""
     file_path = Path(path)
     if file_path.suffix.lower() == ".csv":
-        return list(_load_csv(file_path))
+        yield from _load_csv(file_path)
+        return
     data = _load_json(file_path)
     if isinstance(data, list):
-        return [{k: str(v) for k, v in item.items() if v is not None} for item in data]
-    if isinstance(data, dict):
-        return [{k: str(v) for k, v in data.items() if v is not None}]
-    raise ValueError("Unsupported input structure. Provide JSON array/object or CSV file.")
+        for item in data:
+            yield _card_fields(item)
+    elif isinstance(data, dict):
+        yield _card_fields(data)
+    else:
+        raise ValueError("Unsupported input structure. Provide JSON array/object or CSV file.")
+
+
+def _card_fields(data: Dict[str, object]) -> Dict[str, str]:
+    # JSON values are almost always strings already; only coerce the rest.
+    return {k: v if type(v) is str else str(v) for k, v in data.items() if v is not None}
 
 
 def _load_json(path: Path):
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     with path.open("r", encoding="utf-8") as fh:
         return json.load(fh)
 
@@ -41,4 +61,4 @@ def _load_csv(path: Path) -> Iterable[Dict[str, str]]:
             yield {k: v for k, v in row.items() if v}
 
 
-__all__ = ["load_card", "load_cards"]
+__all__ = ["load_card", "load_cards", "iter_cards"]